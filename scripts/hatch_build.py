@@ -5,6 +5,18 @@ from pathlib import Path
 from typing import Any
 from hatchling.builders.hooks.plugin.interface import BuildHookInterface
 
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+
+class _ExpandingDumper(_SafeDumper):
+    """Dumper that writes shared nodes out in full instead of as &anchor / *alias"""
+
+    def ignore_aliases(self, data):
+        return True
+
 
 def dir_name_to_label(name: str) -> str:
     """Convert directory name to human-readable label."""
@@ -17,29 +29,39 @@ class YAMLAggregator:
 
     def __init__(self, demo_dir: Path, search_paths: list[Path] = None):
         self.demo_dir = demo_dir
-        self.search_paths = search_paths or [demo_dir]
+        self.search_paths = tuple(search_paths or [demo_dir])
         self.widgets = {}  # Merged widgets
         self.data = {}  # Merged data
         self.app_config = None  # App configuration
         self.visited_modules = set()  # Track visited modules to avoid cycles
+        self.stripped_refs = {}  # reference -> stripped name, or None if left unchanged
+        self.resolved_modules = {}  # module name -> resolved file, or None if not found
 
     def find_yaml_file(self, module_name: str) -> Path | None:
-        """Find a YAML file in search paths"""
-        module_path = module_name.replace('.', '/')
-        yaml_filename = f"{module_path}.yaml"
+        """Find a YAML file in search paths (memoized per module name)"""
+        try:
+            return self.resolved_modules[module_name]
+        except KeyError:
+            pass
+
+        *module_dirs, module_stem = module_name.split('.')
+        rel_path = Path(*module_dirs, f"{module_stem}.yaml")
 
+        module_file = None
         for search_path in self.search_paths:
-            candidate = search_path / yaml_filename
+            candidate = search_path / rel_path
             if candidate.exists():
-                return candidate
-        return None
+                module_file = candidate
+                break
+
+        self.resolved_modules[module_name] = module_file
+        return module_file
 
     def load_yaml(self, file_path: Path) -> dict:
         """Load YAML file"""
         try:
-            with open(file_path, 'r') as f:
-                content = yaml.safe_load(f)
-                return content or {}
+            content = yaml.load(file_path.read_bytes(), Loader=_SafeLoader)
+            return content or {}
         except Exception as e:
             print(f"  Warning: Error loading {file_path}: {e}")
             return {}
@@ -66,12 +88,15 @@ class YAMLAggregator:
         for imported_module in imports:
             self.process_module(imported_module)
 
-        # Merge widgets WITHOUT namespace in widget name, but track the module
+        # Merge widgets WITHOUT namespace in widget name
         widgets = module_content.get('widgets', {})
         for widget_name, widget_def in widgets.items():
             if widget_name in self.widgets:
                 print(f"  Warning: Duplicate widget '{widget_name}' from '{module_name}', overwriting")
-            self.widgets[widget_name] = (module_name, widget_def)
+            self.widgets[widget_name] = widget_def
+        if widgets:
+            # Stripping depends on the known widget names
+            self.stripped_refs.clear()
 
         # Merge data
         data = module_content.get('data', {})
@@ -95,64 +120,104 @@ class YAMLAggregator:
         if '.' not in ref:
             return ref
 
-        # Try progressively stripping prefixes until we find a match
-        parts = ref.split('.')
-        for i in range(1, len(parts)):
-            widget_name = '.'.join(parts[i:])
-            if widget_name in self.widgets:
-                return widget_name
-
-        return ref
+        # The same references repeat across a config - remember each answer
+        try:
+            stripped = self.stripped_refs[ref]
+        except KeyError:
+            stripped = None
+            # Try progressively stripping prefixes until we find a match
+            parts = ref.split('.')
+            for i in range(1, len(parts)):
+                widget_name = '.'.join(parts[i:])
+                if widget_name in self.widgets:
+                    stripped = widget_name
+                    break
+            self.stripped_refs[ref] = stripped
+
+        return ref if stripped is None else stripped
 
     def process_widget_references(self, obj: Any) -> Any:
         """
-        Recursively process widget references in the structure.
+        Process widget references in the structure, in place.
 
         Strips module prefixes from widget references to match the
         aggregated widget declarations (which have no namespace).
+        Walks with an explicit stack so deeply nested trees don't hit the
+        recursion limit. Dicts and lists are updated in place and returned;
+        a bare string is returned stripped.
         """
-        if isinstance(obj, dict):
-            result = {}
-            for key, value in obj.items():
-                # Widget references can appear as dict keys (e.g., "widgets.basic.demo: null")
-                new_key = self.strip_module_prefix(key)
-                # Check keys that typically contain widget references
-                if key in ('body', 'type', 'widget') and isinstance(value, str):
-                    result[new_key] = self.strip_module_prefix(value)
-                else:
-                    result[new_key] = self.process_widget_references(value)
-            return result
-        elif isinstance(obj, list):
-            return [self.process_widget_references(item) for item in obj]
-        elif isinstance(obj, str):
-            # String values in lists might be widget references
-            return self.strip_module_prefix(obj)
-        else:
-            return obj
+        strip = self.strip_module_prefix
+        if type(obj) is str:
+            return strip(obj)
+
+        stack = [obj]
+        seen = set()  # ids of processed containers - YAML aliases may share nodes
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            if node_type is dict:
+                if id(node) in seen:
+                    continue
+                seen.add(id(node))
+                renamed = False
+                for key, value in node.items():
+                    # Widget references can appear as dict keys (e.g., "widgets.basic.demo: null")
+                    # and as string values (e.g., "body", "type", "widget")
+                    if type(key) is str and strip(key) is not key:
+                        renamed = True
+                    value_type = type(value)
+                    if value_type is str:
+                        new_value = strip(value)
+                        if new_value is not value:
+                            node[key] = new_value
+                    elif value_type is dict or value_type is list:
+                        stack.append(value)
+                if renamed:
+                    # Rebuild in place to keep key order
+                    items = [(strip(key) if type(key) is str else key, value) for key, value in node.items()]
+                    node.clear()
+                    node.update(items)
+            elif node_type is list:
+                if id(node) in seen:
+                    continue
+                seen.add(id(node))
+                for index, item in enumerate(node):
+                    item_type = type(item)
+                    if item_type is str:
+                        # String values in lists might be widget references
+                        new_item = strip(item)
+                        if new_item is not item:
+                            node[index] = new_item
+                    elif item_type is dict or item_type is list:
+                        stack.append(item)
+
+        return obj
 
     def aggregate(self, main_module: str) -> dict:
         """Aggregate all YAML files starting from main module"""
         # Process main module and all its dependencies
         self.process_module(main_module)
 
-        # Build final structure
+        # Build final structure - references are rewritten in place, so the
+        # merged sections are handed out without copying
+        walk = self.process_widget_references
         result = {}
 
         # Add app config if present
         if self.app_config:
-            result['app'] = self.process_widget_references(self.app_config)
+            result['app'] = walk(self.app_config)
 
         # Add all widgets
         if self.widgets:
-            result['widgets'] = {}
-            for widget_name, (module_name, widget_def) in self.widgets.items():
-                result['widgets'][widget_name] = self.process_widget_references(widget_def)
+            for name, widget_def in self.widgets.items():
+                self.widgets[name] = walk(widget_def)
+            result['widgets'] = self.widgets
 
         # Add all data
         if self.data:
-            result['data'] = {}
-            for data_name, data_def in self.data.items():
-                result['data'][data_name] = self.process_widget_references(data_def)
+            for name, data_def in self.data.items():
+                self.data[name] = walk(data_def)
+            result['data'] = self.data
 
         return result
 
@@ -160,13 +225,18 @@ class YAMLAggregator:
         """Save aggregated YAML to file"""
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, 'w') as f:
-            # Add header comment
-            f.write(f"# Aggregated YAML demo for browser (Pyodide)\n")
-            f.write(f"# Source: {self.demo_dir}\n")
-            f.write(f"# Feel free to edit and experiment!\n\n")
-
-            yaml.dump(content, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        # Add header comment
+        header = (
+            f"# Aggregated YAML demo for browser (Pyodide)\n"
+            f"# Source: {self.demo_dir}\n"
+            f"# Feel free to edit and experiment!\n\n"
+        )
+        # With an encoding and no stream, the emitter returns the whole document as bytes
+        body = yaml.dump(content, Dumper=_ExpandingDumper, default_flow_style=False, sort_keys=False,
+                         allow_unicode=True, encoding='utf-8')
+
+        with open(output_file, 'wb') as f:
+            f.write(header.encode('utf-8') + body)
 
 
 class CustomBuildHook(BuildHookInterface):
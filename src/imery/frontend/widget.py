@@ -62,6 +62,7 @@ class Widget(Visual, EventHandler):
             data_bag: DataBag instance for data access
         """
         super().__init__()
+        self._imgui_id = f"###{self.uid}"  # uid never changes, so the ImGui id is built once
         self._factory = factory
         self._dispatcher = dispatcher
         self._namespace = namespace
@@ -39,7 +39,7 @@ class DragInt(Widget):
         if res:
             speed = res.unwrapped
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
 
         changed, new_val = imgui.drag_int(imgui_id, int_value, speed, minv, maxv)
         if changed:
@@ -81,7 +81,7 @@ class DragFloat(Widget):
         if res:
             speed = float(res.unwrapped)
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
 
         changed, new_val = imgui.drag_float(imgui_id, float_value, speed, minv, maxv)
         if changed:
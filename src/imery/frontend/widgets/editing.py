@@ -22,7 +22,7 @@ class InputText(Widget):
             return Result.error("InputText: failed to get value", res)
         value = res.unwrapped
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
 
         changed, new_val = imgui.input_text(imgui_id, str(value))
         if changed:
@@ -48,7 +48,7 @@ class InputInt(Widget):
         except (ValueError, TypeError):
             return Result.error(f"InputInt: invalid integer value '{value}'")
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
 
         changed, new_val = imgui.input_int(imgui_id, int_value)
         if changed:
@@ -74,7 +74,7 @@ class InputFloat(Widget):
         except (ValueError, TypeError):
             return Result.error(f"InputFloat: invalid float value '{value}'")
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
 
         changed, new_val = imgui.input_float(imgui_id, float_value)
         if changed:
@@ -121,7 +121,7 @@ class SliderInt(Widget):
             if not set_res:
                 return Result.error(f"SliderInt: failed to set default", set_res)
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
 
         if scale == "log":
             # Logarithmic scale
@@ -173,7 +173,7 @@ class SliderFloat(Widget):
         if res:
             maxv = float(res.unwrapped)
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
 
         changed, new_val = imgui.slider_float(imgui_id, current_value, minv, maxv)
         if changed:
@@ -12,6 +12,22 @@ from imery.result import Result, Ok
 class Listbox(Widget):
     """Listbox widget"""
 
+    def __init__(self, factory, dispatcher, namespace: str, data_bag):
+        super().__init__(factory, dispatcher, namespace, data_bag)
+        # item -> first index of the last indexed items list
+        self._indexed_items = None
+        self._indexed_len = 0
+        self._item_index = {}
+
+    def _index_items(self, items: list):
+        """Map each item to its first index, like list.index"""
+        item_index = {}
+        for i, item in enumerate(items):
+            item_index.setdefault(item, i)
+        self._item_index = item_index
+        self._indexed_items = items
+        self._indexed_len = len(items)
+
     def _pre_render_head(self) -> Result[None]:
         value_res = self._data_bag.get("label")
         if not value_res:
@@ -28,12 +44,22 @@ class Listbox(Widget):
         if res:
             height = res.unwrapped
 
-        try:
-            idx = items.index(str(current_value))
-        except ValueError:
-            idx = 0
+        value = current_value if type(current_value) is str else str(current_value)
+        if items is not self._indexed_items or len(items) != self._indexed_len:
+            self._index_items(items)
+        idx = self._item_index.get(value)
+        if idx is not None and items[idx] != value:
+            # An item was replaced in place (DataTree.set) - the index is stale
+            self._index_items(items)
+            idx = self._item_index.get(value)
+        if idx is None:
+            # Not indexed - scan instead of reindexing, the value may just be unset
+            try:
+                idx = items.index(value)
+            except ValueError:
+                idx = 0
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
         changed, idx = imgui.list_box(imgui_id, idx, items, height)
         if changed and 0 <= idx < len(items):
             set_res = self._data_bag.set("label", items[idx])
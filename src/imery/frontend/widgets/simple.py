@@ -105,7 +105,7 @@ class Combo(Widget):
         except ValueError:
             idx = 0
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
         changed, idx = imgui.combo(imgui_id, idx, items)
         if changed and 0 <= idx < len(items):
             set_res = self._data_bag.set("label", items[idx])
@@ -126,7 +126,7 @@ class Checkbox(Widget):
             return Result.error(f"Checkbox: failed to get value", value_res)
         current_value = str(value_res.unwrapped).lower() in ("true", "1", "yes")
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
 
         changed, new_val = imgui.checkbox(imgui_id, current_value)
         if changed:
@@ -159,7 +159,7 @@ class RadioButton(Widget):
         # Radio button is active if current value matches button value
         active = (current_value == button_value)
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
         if imgui.radio_button(imgui_id, active):
             # Set the value to this button's value
             set_res = self._data_bag.set("label", button_value)
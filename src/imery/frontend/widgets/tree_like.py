@@ -416,7 +416,7 @@ class ColorEdit(Widget):
         if not isinstance(value, list) or len(value) != 4:
             value = [1.0, 1.0, 1.0, 1.0]  # Default white
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
 
         changed, new_color = imgui.color_edit4(imgui_id, value)
         if changed:
@@ -454,7 +454,7 @@ class ColorButton(Widget):
         # Convert to ImVec4
         color = imgui.ImVec4(value[0], value[1], value[2], value[3])
 
-        imgui_id = f"###{self.uid}"
+        imgui_id = self._imgui_id
 
         clicked = imgui.color_button(imgui_id, color)
         if clicked:
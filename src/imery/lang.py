@@ -2,8 +2,12 @@
 Language module - handles YAML loading and module management for imery layouts
 """
 
+import os
+import stat
 import yaml
 import httpx
+import pickle
+import hashlib
 import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Union
@@ -11,6 +15,71 @@ from collections import deque
 from imery.types import Object
 from imery.result import Result, Ok
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Shared read-only fallbacks for missing module sections - never mutated
+_EMPTY_DICT = {}
+_EMPTY_LIST = []
+
+_YAML_CACHE_DIR = Path(tempfile.gettempdir()) / "imery_yaml_cache"
+
+
+def _yaml_cache_usable() -> bool:
+    """Only trust a private cache directory we own - pickles are executable"""
+    try:
+        _YAML_CACHE_DIR.mkdir(mode=0o700, exist_ok=True)
+        st = os.lstat(_YAML_CACHE_DIR)
+    except OSError:
+        return False
+    # mkdir's mode only applies on creation - reject a pre-existing shared directory
+    if not stat.S_ISDIR(st.st_mode) or st.st_mode & 0o077:
+        return False
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return False
+    return True
+
+
+def _parse_cached(path: Path, use_cache: bool):
+    """
+    Parse a YAML file, reusing a pickled copy while (path, mtime, size) is unchanged
+
+    use_cache should come from _yaml_cache_usable(), checked once per load.
+    Raises OSError / yaml.YAMLError like a plain parse; cache failures are ignored.
+    """
+    if not use_cache:
+        return yaml.load(path.read_bytes(), Loader=_SafeLoader)
+
+    path = path.absolute()
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cache_file = _YAML_CACHE_DIR / hashlib.sha1(str(path).encode()).hexdigest()
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, content = pickle.load(f)
+        if cached_key == key:
+            return content
+    except Exception:
+        # Missing, stale or corrupt cache entry - fall through to parsing
+        pass
+
+    # Layout files are small - hand the parser one contiguous buffer of raw
+    # bytes; libyaml detects and decodes UTF-8 itself
+    content = yaml.load(path.read_bytes(), Loader=_SafeLoader)
+
+    try:
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((key, content), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception:
+        pass
+
+    return content
+
 
 class Lang(Object):
     """
@@ -33,18 +102,21 @@ class Lang(Object):
         builtin_layouts_dir = Path(__file__).parent / "frontend" / "layouts"
 
         # Separate local paths and URLs
-        self._local_paths = [builtin_layouts_dir]
+        local_paths = [builtin_layouts_dir]
         self._url_bases = []
 
         for item in layouts_paths:
             if isinstance(item, str) and (item.startswith('http://') or item.startswith('https://')):
                 self._url_bases.append(item.rstrip('/'))
             else:
-                self._local_paths.append(Path(item))
+                local_paths.append(Path(item))
+
+        self._local_paths = tuple(local_paths)
 
         # Create temp directory for downloaded YAML files
         self._temp_dir = Path(tempfile.mkdtemp(prefix='imery_layouts_'))
 
+        self._dir_entries = {}  # directory -> {case-folded name: [DirEntry]}, filled lazily by os.scandir
         self._widget_definitions = {}  # full_name (namespace.widget) -> widget definition
         self._data_definitions = {}  # data_name -> data definition
         self._app_config = None  # app configuration
@@ -68,6 +140,38 @@ class Lang(Object):
             shutil.rmtree(self._temp_dir)
         return Ok(None)
 
+    def _dir_has_file(self, directory: Path, name: str) -> bool:
+        """
+        Check whether directory holds a regular file called name
+
+        Each directory is listed once with os.scandir and indexed by case-folded
+        name. An exact match is answered from its DirEntry. A match that differs
+        only in case is left to the filesystem, so case-insensitive filesystems
+        still resolve "Widgets" to widgets.yaml.
+        """
+        entries = self._dir_entries.get(directory)
+        if entries is None:
+            entries = {}
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        entries.setdefault(entry.name.casefold(), []).append(entry)
+            except OSError:
+                pass
+            self._dir_entries[directory] = entries
+
+        candidates = entries.get(name.casefold())
+        if not candidates:
+            return False
+        for entry in candidates:
+            if entry.name == name:
+                # is_file() follows symlinks: broken links and directories don't count
+                try:
+                    return entry.is_file()
+                except OSError:
+                    return False
+        return (directory / name).is_file()
+
     def load_main_module(self, module_name: str) -> Result[None]:
         """
         Load the main module and all its dependencies (breadth-first)
@@ -78,27 +182,30 @@ class Lang(Object):
         Returns:
             Result[None]: Ok on success, Error on failure
         """
-        queue = deque([module_name, "builtin"])
-        visited = set()
+        # "builtin" is always loaded: widgets render errors with builtin.error-tree-view.
+        # dict.fromkeys drops it from the start queue when it is the main module itself
+        queue = deque(dict.fromkeys([module_name, "builtin"]))
+        queued = set(queue)  # Everything ever enqueued - each module is queued at most once
+        local_paths = self._local_paths
+        use_yaml_cache = _yaml_cache_usable()
+        # Directory listings are only reused within one load
+        self._dir_entries.clear()
 
         while queue:
             current_module = queue.popleft()
 
-            if current_module in visited:
-                continue
-
-            visited.add(current_module)
-
             # Find module file - support directory-based namespaces
             # Convert dots to slashes: "widgets.buttons" → "widgets/buttons.yaml"
             module_file = None
-            module_path = current_module.replace('.', '/')
-            yaml_filename = f"{module_path}.yaml"
+            downloaded = False
+            *module_dirs, module_stem = current_module.split('.')
+            rel_path = Path(*module_dirs, f"{module_stem}.yaml")
+            yaml_filename = rel_path.as_posix()
 
             # Try local paths first
-            for layouts_path in self._local_paths:
-                candidate = layouts_path / yaml_filename
-                if candidate.exists():
+            for layouts_path in local_paths:
+                candidate = layouts_path / rel_path
+                if self._dir_has_file(candidate.parent, candidate.name):
                     module_file = candidate
                     break
 
@@ -114,6 +221,7 @@ class Lang(Object):
                             cached_file.parent.mkdir(parents=True, exist_ok=True)
                             cached_file.write_text(response.text)
                             module_file = cached_file
+                            downloaded = True
                             break
                     except (httpx.HTTPError, httpx.TimeoutException, OSError) as e:
                         # HTTP errors, timeouts, or file system errors - try next URL
@@ -124,28 +232,36 @@ class Lang(Object):
 
             # Load YAML
             try:
-                with open(module_file, 'r') as f:
-                    module_content = yaml.safe_load(f)
+                # Downloads land in a fresh temp dir each run - caching them would only leak entries
+                module_content = _parse_cached(module_file, use_yaml_cache and not downloaded)
             except (OSError, yaml.YAMLError) as e:
                 return Result.error(f"Failed to load YAML from '{module_file}': {e}")
 
             if module_content is None:
-                module_content = {}
+                module_content = _EMPTY_DICT
 
             # Process widgets - namespace by module name
-            widgets = module_content.get("widgets", {})
+            widgets = module_content.get("widgets") or _EMPTY_DICT
+            namespace_prefix = f"{current_module}."
+            widget_definitions = self._widget_definitions
             for widget_name, widget_def in widgets.items():
-                full_name = f"{current_module}.{widget_name}"
-                if full_name in self._widget_definitions:
+                # f-string, not +: YAML keys may be ints (e.g. "1" -> "main.1")
+                full_name = f"{namespace_prefix}{widget_name}"
+                # One hash operation on the common path: setdefault only inserts
+                # when the name is new, which the size change tells us
+                known_count = len(widget_definitions)
+                widget_definitions.setdefault(full_name, widget_def)
+                if len(widget_definitions) == known_count:
                     return Result.error(f"Duplicate widget definition: '{full_name}'")
-                self._widget_definitions[full_name] = widget_def
 
             # Process data - merge by key
-            data = module_content.get("data", {})
+            data = module_content.get("data") or _EMPTY_DICT
+            data_definitions = self._data_definitions
             for data_name, data_def in data.items():
-                if data_name in self._data_definitions:
+                known_count = len(data_definitions)
+                data_definitions.setdefault(data_name, data_def)
+                if len(data_definitions) == known_count:
                     return Result.error(f"Duplicate data definition: '{data_name}'")
-                self._data_definitions[data_name] = data_def
 
             # Process app - only one allowed
             app = module_content.get("app")
@@ -155,9 +271,13 @@ class Lang(Object):
                 self._app_config = app
 
             # Add imports to queue
-            imports = module_content.get("import", [])
-            if imports:
-                queue.extend(imports)
+            imports = module_content.get("import") or _EMPTY_LIST
+            if isinstance(imports, str):
+                imports = [imports]
+            for imported_module in imports:
+                if imported_module not in queued:
+                    queued.add(imported_module)
+                    queue.append(imported_module)
 
         # Validate final state
         if not self._widget_definitions: